@@ -5,7 +5,39 @@ import aiohttp
 import asyncio
 from discord.ext import commands
 from dotenv import load_dotenv
-import json
+import orjson
+import time
+import logging
+import logging.handlers
+import queue
+import atexit
+import functools
+import random
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging():
+    """Log through a queue so handlers write from a background thread, not the event loop"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    level_name = os.getenv("LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        level = logging.INFO
+    root.setLevel(level)
+    if level_name != logging.getLevelName(level):
+        logger.warning("⚠️ Unknown LOG_LEVEL %r, using INFO", level_name)
+
 
 # Debug: Check if .env file is being loaded
 print("🔍 Checking .env file...")
@@ -20,10 +52,51 @@ if BOT_TOKEN:
 else:
     print("❌ BOT_TOKEN is None or empty!")
 
+# Shared by every API call; tight connect/read limits keep one slow API from eating the whole budget
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_connect=3, sock_read=8)
+
+# Max in-flight requests per API host, keeps bursts under upstream rate limits
+API_CONCURRENCY_PER_HOST = 8
+_api_semaphores = {}
+
+
+def api_semaphore(url: str) -> asyncio.Semaphore:
+    """Get the concurrency limiter for the host of a URL"""
+    host = urlsplit(url).netloc
+    semaphore = _api_semaphores.get(host)
+    if semaphore is None:
+        semaphore = _api_semaphores[host] = asyncio.Semaphore(API_CONCURRENCY_PER_HOST)
+    return semaphore
+
+
+class ScannerBot(commands.Bot):
+    """Bot with a shared HTTP session for all token API calls"""
+
+    session: aiohttp.ClientSession
+
+    async def setup_hook(self):
+        # One long-lived session so API calls reuse pooled keep-alive connections
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=HTTP_TIMEOUT
+        )
+
+    async def close(self):
+        if getattr(self, 'session', None) and not self.session.closed:
+            await self.session.close()
+        await super().close()
+
+
 # Bot setup
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = ScannerBot(command_prefix="!", intents=intents)
 
 # Regular expressions for address patterns
 ADDRESS_PATTERNS = {
@@ -32,6 +105,75 @@ ADDRESS_PATTERNS = {
     "url": r"http[s]?://[^\s]+"
 }
 
+# Single pass over a message: EVM and URLs go first since base58 can match inside them
+_ADDR_RE = re.compile(
+    f"(?P<evm>{ADDRESS_PATTERNS['evm']})"
+    f"|(?P<url>{ADDRESS_PATTERNS['url']})"
+    f"|(?P<solana>{ADDRESS_PATTERNS['solana']})"
+)
+
+ADDRESS_TYPE_NAMES = {
+    "solana": "Solana",
+    "evm": "EVM (Ethereum/BSC)",
+    "url": "URL"
+}
+
+# Max addresses handled per message
+MAX_ADDRESSES_PER_MESSAGE = 5
+
+# Static embed field values shared by every token embed
+LIVE_DATA_STATUS_VALUE = "🟢 **Live Data Found**\n📊 Multiple APIs verified\n⚡ Real-time pricing"
+NO_DATA_STATUS_VALUE = "🔴 **No Live Data**\n📊 Token not found in APIs\n⚠️ Verify contract address"
+POSSIBLE_REASONS_VALUE = "🔸 Very new token\n🔸 Low trading volume\n🔸 Not listed on DEXs\n🔸 Invalid contract address"
+SOLANA_NOT_FOUND_MARKET_VALUE = "💵 **Price:** Not Available\n🔥 **FDV:** Not Available\n🏊 **Liquidity:** Not Available\n📈 **Volume:** Not Available"
+EVM_NOT_FOUND_MARKET_VALUE = "💵 **Price:** Not Available\n🏆 **MCap:** Not Available\n🏊 **Liquidity:** Not Available\n📈 **Volume:** Not Available"
+SAFETY_REMINDERS_VALUE = "⚠️ **Always verify contracts**\n🔒 **Check for mint/freeze authority**\n💧 **Verify liquidity is locked**\n🚨 **DYOR before investing**"
+URL_WARNING_VALUE = "⚠️ **Warning:** Web URL detected\n🔒 **Safety:** Always verify domains\n🛡️ **Tip:** Only click official links\n🚨 **Never connect wallet to suspicious sites**"
+
+# Token data cache: (chain, address) -> (expires_at, token_data)
+TOKEN_CACHE_SIZE = 4096
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_MISS_TTL = 5
+_token_cache = {}
+
+# DexScreener conditional GETs: address -> (etag, most liquid pair)
+_dexscreener_etags = {}
+
+
+def cached_token_data(chain: str):
+    """Cache fetcher results per address; failed lookups expire sooner"""
+    def decorator(fetcher):
+        @functools.wraps(fetcher)
+        async def wrapper(address: str):
+            key = (chain, address)
+            now = time.monotonic()
+            entry = _token_cache.get(key)
+            if entry and entry[0] > now:
+                logger.debug("⚡ Cache hit for %s: %s", chain, address)
+                return entry[1]
+
+            token_data = await fetcher(address)
+            ttl = TOKEN_CACHE_TTL if token_data.get('success') else TOKEN_CACHE_MISS_TTL
+
+            _token_cache.pop(key, None)
+            if len(_token_cache) >= TOKEN_CACHE_SIZE:
+                # Drop the oldest entry, dicts keep insertion order
+                del _token_cache[next(iter(_token_cache))]
+            _token_cache[key] = (time.monotonic() + ttl, token_data)
+            return token_data
+        return wrapper
+    return decorator
+
+
+def get_float(data, *keys, default=0.0):
+    """Read a nested numeric API field as float, without building {} defaults"""
+    value = data
+    for key in keys:
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key)
+    return float(value) if value else default
+
 
 def format_percentage(value):
     """Format percentage values with proper colors"""
@@ -45,6 +187,14 @@ def format_percentage(value):
         return f"🔴 {formatted}"
 
 
+# Largest first, so the first threshold reached picks the suffix
+NUMBER_SCALES = (
+    (1_000_000_000, "B"),
+    (1_000_000, "M"),
+    (1_000, "K")
+)
+
+
 def format_number(num):
     """Format numbers for display"""
     if num is None or num == 0:
@@ -52,469 +202,587 @@ def format_number(num):
 
     try:
         num = float(num)
-        if num >= 1_000_000_000:
-            return f"${num/1_000_000_000:.2f}B"
-        elif num >= 1_000_000:
-            return f"${num/1_000_000:.2f}M"
-        elif num >= 1_000:
-            return f"${num/1_000:.2f}K"
-        elif num >= 1:
+        for threshold, suffix in NUMBER_SCALES:
+            if num >= threshold:
+                return f"${num/threshold:.2f}{suffix}"
+        if num >= 1:
             return f"${num:.4f}"
-        else:
-            return f"${num:.8f}"
+        return f"${num:.8f}"
     except:
         return "N/A"
 
 
+# Retry policy for flaky upstream APIs
+API_RETRIES = 2
+API_RETRY_BASE_DELAY = 0.25
+API_RETRY_MAX_DELAY = 5
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _retry_delay(attempt: int, retry_after=None) -> float:
+    """Backoff delay for a retry, honoring Retry-After when it is given in seconds"""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return API_RETRY_BASE_DELAY * 2 ** attempt + random.random() * 0.1
+
+
+async def _read_json(response):
+    """Decode a whole JSON response body"""
+    return await response.json(loads=orjson.loads, content_type=None)
+
+
+async def get_json(url: str, retries: int = API_RETRIES, parse=_read_json, headers=None):
+    """GET a JSON API, retrying transient failures; returns None on a non-200 response
+
+    A 304 reply to a conditional request is also handed to parse. All attempts
+    and backoff sleeps together stay within the HTTP_TIMEOUT budget.
+    """
+    return await asyncio.wait_for(
+        _get_json_with_retries(url, retries, parse, headers),
+        timeout=HTTP_TIMEOUT.total
+    )
+
+
+async def _get_json_with_retries(url, retries, parse, headers):
+    """Retry loop behind get_json"""
+    deadline = time.monotonic() + HTTP_TIMEOUT.total
+    for attempt in range(retries + 1):
+        retry_after = None
+        try:
+            async with api_semaphore(url), bot.session.get(url, headers=headers) as response:
+                if response.status == 200 or response.status == 304 and headers:
+                    return await parse(response)
+                if response.status not in RETRYABLE_STATUSES or attempt == retries:
+                    return None
+                retry_after = response.headers.get('Retry-After')
+                logger.warning("⚠️ HTTP %s from %s, retrying...", response.status, url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == retries:
+                raise
+            logger.warning("⚠️ Request to %s failed (%s), retrying...", url, e)
+
+        delay = _retry_delay(attempt, retry_after)
+        if delay > API_RETRY_MAX_DELAY or time.monotonic() + delay >= deadline:
+            # Respect a long Retry-After instead of hammering a throttled API
+            logger.warning("⚠️ Not retrying %s, backoff of %.1fs exceeds the time left", url, delay)
+            return None
+
+        # Sleep outside the semaphore so other requests can use the slot
+        await asyncio.sleep(delay)
+
+
+def solana_links(address: str) -> str:
+    """Quick access links for a Solana token"""
+    return (
+        f"[📊 Solscan](https://solscan.io/token/{address}) • "
+        f"[🐦 Birdeye](https://birdeye.so/token/{address}) • "
+        f"[📈 DexScreener](https://dexscreener.com/solana/{address}) • "
+        f"[💹 Jupiter](https://jup.ag/swap/SOL-{address})"
+    )
+
+
+def evm_links(address: str) -> str:
+    """Quick access links for an EVM token"""
+    return (
+        f"[📊 Etherscan](https://etherscan.io/address/{address}) • "
+        f"[🛠️ DexTools](https://www.dextools.io/app/en/ether/pair-explorer/{address}) • "
+        f"[📈 DexScreener](https://dexscreener.com/ethereum/{address}) • "
+        f"[🦄 Uniswap](https://app.uniswap.org/#/tokens/ethereum/{address})"
+    )
+
+
+def most_liquid_pair(pairs):
+    """Get the most liquid pair in a single pass"""
+    pair = None
+    best_liquidity = -1.0
+    for candidate in pairs:
+        candidate_liquidity = get_float(candidate, 'liquidity', 'usd')
+        if candidate_liquidity > best_liquidity:
+            best_liquidity, pair = candidate_liquidity, candidate
+    return pair
+
+
+async def _parse_dexscreener_pair(response):
+    """Read only the most liquid pair out of a DexScreener response"""
+    data = await _read_json(response)
+    return most_liquid_pair(data.get('pairs') or [])
+
+
+async def _fetch_dexscreener(address: str):
+    """Fetch market data for the most liquid DexScreener pair"""
+    url = f"https://api.dexscreener.com/latest/dex/tokens/{address}"
+    logger.debug("🌐 Trying DexScreener: %s", url)
+
+    # Revalidate with the last ETag so an unchanged token skips the body entirely
+    cached = _dexscreener_etags.get(address)
+    headers = {'If-None-Match': cached[0]} if cached else None
+
+    async def parse(response):
+        if response.status == 304:
+            logger.debug("⚡ DexScreener not modified: %s", address)
+            return cached[1]
+
+        pair = await _parse_dexscreener_pair(response)
+        etag = response.headers.get('ETag')
+        _dexscreener_etags.pop(address, None)
+        if etag:
+            if len(_dexscreener_etags) >= TOKEN_CACHE_SIZE:
+                del _dexscreener_etags[next(iter(_dexscreener_etags))]
+            _dexscreener_etags[address] = (etag, pair)
+        return pair
+
+    pair = await get_json(url, parse=parse, headers=headers)
+    if pair is None:
+        return {}
+
+    base_token = pair.get('baseToken', {})
+    return {
+        'name': base_token.get('name', 'Unknown Token'),
+        'symbol': base_token.get('symbol', 'UNKNOWN'),
+        'price': get_float(pair, 'priceUsd'),
+        'volume24h': get_float(pair, 'volume', 'h24'),
+        'liquidity': get_float(pair, 'liquidity', 'usd'),
+        'fdv': get_float(pair, 'fdv'),
+        'marketCap': get_float(pair, 'marketCap'),
+        'priceChange24h': get_float(pair, 'priceChange', 'h24'),
+        'priceChange1h': get_float(pair, 'priceChange', 'h1'),
+    }
+
+
+async def _fetch_jupiter(address: str):
+    """Fetch a Solana token price from Jupiter"""
+    url = f"https://price.jup.ag/v4/price?ids={address}"
+    logger.debug("🌐 Trying Jupiter: %s", url)
+
+    data = await get_json(url)
+    if data is None:
+        return {}
+
+    price_data = data.get('data', {}).get(address)
+    if not price_data:
+        return {}
+    return {'price': get_float(price_data, 'price')}
+
+
+async def _fetch_solscan_meta(address: str):
+    """Fetch Solana token name/symbol from Solscan"""
+    url = f"https://public-api.solscan.io/token/meta?tokenAddress={address}"
+    logger.debug("🌐 Trying Solscan metadata: %s", url)
+
+    data = await get_json(url)
+    if not data or 'name' not in data:
+        return {}
+    return {
+        'name': data.get('name', 'Unknown Token'),
+        'symbol': data.get('symbol', 'UNKNOWN'),
+    }
+
+
+async def _fetch_coingecko(address: str):
+    """Fetch EVM token market data from CoinGecko"""
+    url = f"https://api.coingecko.com/api/v3/simple/token_price/ethereum?contract_addresses={address}&vs_currencies=usd&include_24hr_change=true&include_24hr_vol=true&include_market_cap=true"
+    logger.debug("🌐 Trying CoinGecko: %s", url)
+
+    data = await get_json(url)
+    if data is None:
+        return {}
+
+    token_info = data.get(address.lower())
+    if not token_info:
+        return {}
+    return {
+        'price': get_float(token_info, 'usd'),
+        'priceChange24h': get_float(token_info, 'usd_24h_change'),
+        'volume24h': get_float(token_info, 'usd_24h_vol'),
+        'marketCap': get_float(token_info, 'usd_market_cap'),
+    }
+
+
+async def _probe(name: str, fetch):
+    """Await one API probe, logging a failure as an empty result"""
+    try:
+        result = await fetch
+    except Exception as e:
+        logger.warning("❌ %s error: %r", name, e)
+        return {}
+    if result:
+        logger.debug("✅ %s success", name)
+    return result
+
+
+@cached_token_data("solana")
 async def get_solana_token_data(address: str):
     """Fetch Solana token data from multiple APIs"""
-    print(f"🔍 Fetching Solana data for: {address}")
+    logger.debug("🔍 Fetching Solana data for: %s", address)
 
     try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            token_data = {
-                'name': 'Unknown Token',
-                'symbol': 'UNKNOWN',
-                'price': 0,
-                'volume24h': 0,
-                'priceChange24h': 0,
-                'priceChange1h': 0,
-                'liquidity': 0,
-                'fdv': 0,
-                'marketCap': 0,
-                'success': False
-            }
-
-            # Try DexScreener first (most reliable for Solana)
+        token_data = {
+            'name': 'Unknown Token',
+            'symbol': 'UNKNOWN',
+            'price': 0,
+            'volume24h': 0,
+            'priceChange24h': 0,
+            'priceChange1h': 0,
+            'liquidity': 0,
+            'fdv': 0,
+            'marketCap': 0,
+            'success': False
+        }
+
+        # Start Jupiter alongside DexScreener (the most reliable for Solana),
+        # but only wait for it when DexScreener comes up empty
+        fallback = asyncio.create_task(_probe("Jupiter", _fetch_jupiter(address)))
+        try:
+            dex = await _probe("DexScreener", _fetch_dexscreener(address))
+            if dex:
+                token_data.update(dex, success=True)
+            else:
+                # Jupiter only provides a price, use it as backup
+                jupiter = await fallback
+                if jupiter:
+                    token_data.update(jupiter, success=True)
+        finally:
+            fallback.cancel()
+
+        # Solscan is the slowest API, only ask it when the name is still missing
+        if token_data['name'] == 'Unknown Token':
             try:
-                url = f"https://api.dexscreener.com/latest/dex/tokens/{address}"
-                print(f"🌐 Trying DexScreener: {url}")
-
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        pairs = data.get('pairs', [])
-
-                        if pairs and len(pairs) > 0:
-                            # Get the most liquid pair
-                            pair = max(pairs, key=lambda p: float(p.get('liquidity', {}).get('usd', 0) or 0))
-
-                            base_token = pair.get('baseToken', {})
-                            token_data.update({
-                                'name': base_token.get('name', 'Unknown Token'),
-                                'symbol': base_token.get('symbol', 'UNKNOWN'),
-                                'price': float(pair.get('priceUsd', 0) or 0),
-                                'volume24h': float(pair.get('volume', {}).get('h24', 0) or 0),
-                                'liquidity': float(pair.get('liquidity', {}).get('usd', 0) or 0),
-                                'fdv': float(pair.get('fdv', 0) or 0),
-                                'marketCap': float(pair.get('marketCap', 0) or 0),
-                                'priceChange24h': float(pair.get('priceChange', {}).get('h24', 0) or 0),
-                                'priceChange1h': float(pair.get('priceChange', {}).get('h1', 0) or 0),
-                                'success': True
-                            })
-                            print(f"✅ DexScreener success: {token_data['name']} ({token_data['symbol']})")
-
+                token_data.update(await _fetch_solscan_meta(address))
             except Exception as e:
-                print(f"❌ DexScreener error: {e}")
-
-            # Try Jupiter API as backup for Solana tokens
-            if not token_data.get('success'):
-                try:
-                    url = f"https://price.jup.ag/v4/price?ids={address}"
-                    print(f"🌐 Trying Jupiter: {url}")
-
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            price_data = data.get('data', {}).get(address)
-
-                            if price_data:
-                                token_data.update({
-                                    'price': float(price_data.get('price', 0)),
-                                    'success': True
-                                })
-                                print(f"✅ Jupiter price found: ${token_data['price']}")
-
-                except Exception as e:
-                    print(f"❌ Jupiter error: {e}")
-
-            # Try to get token metadata from Solana APIs
-            if token_data['name'] == 'Unknown Token':
-                try:
-                    # Try Solscan API
-                    url = f"https://public-api.solscan.io/token/meta?tokenAddress={address}"
-                    print(f"🌐 Trying Solscan metadata: {url}")
-
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if data and 'name' in data:
-                                token_data.update({
-                                    'name': data.get('name', 'Unknown Token'),
-                                    'symbol': data.get('symbol', 'UNKNOWN'),
-                                })
-                                print(f"✅ Solscan metadata: {token_data['name']}")
-
-                except Exception as e:
-                    print(f"❌ Solscan metadata error: {e}")
-
-            print(f"📊 Final Solana data: {token_data}")
-            return token_data
+                logger.warning("❌ Solscan metadata error: %r", e)
+
+        logger.debug("📊 Final Solana data: %s", token_data)
+        return token_data
 
     except Exception as e:
-        print(f"❌ Error fetching Solana data: {e}")
+        logger.error("❌ Error fetching Solana data: %s", e)
         return {'success': False, 'name': 'Unknown Token', 'symbol': 'UNKNOWN'}
 
 
+@cached_token_data("evm")
 async def get_evm_token_data(address: str):
     """Fetch EVM token data"""
-    print(f"🔍 Fetching EVM data for: {address}")
+    logger.debug("🔍 Fetching EVM data for: %s", address)
 
     try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            token_data = {
-                'name': 'Unknown Token',
-                'symbol': 'UNKNOWN',
-                'price': 0,
-                'volume24h': 0,
-                'priceChange24h': 0,
-                'priceChange1h': 0,
-                'liquidity': 0,
-                'marketCap': 0,
-                'success': False
-            }
-
-            # Try DexScreener for EVM tokens
-            try:
-                url = f"https://api.dexscreener.com/latest/dex/tokens/{address}"
-                print(f"🌐 Trying DexScreener EVM: {url}")
-
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        pairs = data.get('pairs', [])
-
-                        if pairs and len(pairs) > 0:
-                            # Get the most liquid pair
-                            pair = max(pairs, key=lambda p: float(p.get('liquidity', {}).get('usd', 0) or 0))
-
-                            base_token = pair.get('baseToken', {})
-                            token_data.update({
-                                'name': base_token.get('name', 'Unknown Token'),
-                                'symbol': base_token.get('symbol', 'UNKNOWN'),
-                                'price': float(pair.get('priceUsd', 0) or 0),
-                                'volume24h': float(pair.get('volume', {}).get('h24', 0) or 0),
-                                'liquidity': float(pair.get('liquidity', {}).get('usd', 0) or 0),
-                                'marketCap': float(pair.get('marketCap', 0) or 0),
-                                'priceChange24h': float(pair.get('priceChange', {}).get('h24', 0) or 0),
-                                'priceChange1h': float(pair.get('priceChange', {}).get('h1', 0) or 0),
-                                'success': True
-                            })
-                            print(f"✅ DexScreener EVM success: {token_data['name']} ({token_data['symbol']})")
-
-            except Exception as e:
-                print(f"❌ DexScreener EVM error: {e}")
-
-            # Try CoinGecko as fallback
-            if not token_data.get('success'):
-                try:
-                    url = f"https://api.coingecko.com/api/v3/simple/token_price/ethereum?contract_addresses={address}&vs_currencies=usd&include_24hr_change=true&include_24hr_vol=true&include_market_cap=true"
-                    print(f"🌐 Trying CoinGecko: {url}")
-
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            token_info = data.get(address.lower())
-
-                            if token_info:
-                                token_data.update({
-                                    'price': float(token_info.get('usd', 0)),
-                                    'priceChange24h': float(token_info.get('usd_24h_change', 0) or 0),
-                                    'volume24h': float(token_info.get('usd_24h_vol', 0) or 0),
-                                    'marketCap': float(token_info.get('usd_market_cap', 0) or 0),
-                                    'success': True
-                                })
-                                print(f"✅ CoinGecko success: ${token_data['price']}")
-
-                except Exception as e:
-                    print(f"❌ CoinGecko error: {e}")
-
-            print(f"📊 Final EVM data: {token_data}")
-            return token_data
+        token_data = {
+            'name': 'Unknown Token',
+            'symbol': 'UNKNOWN',
+            'price': 0,
+            'volume24h': 0,
+            'priceChange24h': 0,
+            'priceChange1h': 0,
+            'liquidity': 0,
+            'marketCap': 0,
+            'success': False
+        }
+
+        # Start CoinGecko alongside DexScreener, but only wait for it as a fallback
+        fallback = asyncio.create_task(_probe("CoinGecko", _fetch_coingecko(address)))
+        try:
+            dex = await _probe("DexScreener EVM", _fetch_dexscreener(address))
+            if dex:
+                # EVM results have no FDV field, keep the same shape as before
+                dex.pop('fdv', None)
+                token_data.update(dex, success=True)
+            else:
+                coingecko = await fallback
+                if coingecko:
+                    token_data.update(coingecko, success=True)
+        finally:
+            fallback.cancel()
+
+        logger.debug("📊 Final EVM data: %s", token_data)
+        return token_data
 
     except Exception as e:
-        print(f"❌ Error fetching EVM data: {e}")
+        logger.error("❌ Error fetching EVM data: %s", e)
         return {'success': False, 'name': 'Unknown Token', 'symbol': 'UNKNOWN'}
 
 
 def detect_address_type(address: str) -> str:
     """Detect the type of address/URL"""
-    if re.fullmatch(ADDRESS_PATTERNS["solana"], address):
-        return "Solana"
-    elif re.fullmatch(ADDRESS_PATTERNS["evm"], address):
-        return "EVM (Ethereum/BSC)"
-    elif re.fullmatch(ADDRESS_PATTERNS["url"], address):
-        return "URL"
-    else:
-        return "Unknown"
+    match = _ADDR_RE.fullmatch(address)
+    if match:
+        return ADDRESS_TYPE_NAMES[match.lastgroup]
+    return "Unknown"
 
 
 @bot.event
 async def on_ready():
-    print(f"✅ Bot is online! Logged in as {bot.user}")
-    print(f"🤖 Bot is in {len(bot.guilds)} servers")
+    logger.info("✅ Bot is online! Logged in as %s", bot.user)
+    logger.info("🤖 Bot is in %d servers", len(bot.guilds))
 
 
-@bot.event
-async def on_message(message):
-    if message.author == bot.user:
-        return
+async def handle_address(message, address, addr_type, avatar_url, timestamp):
+    """Fetch data for one address and post its embed"""
+    loading_msg = None
+    try:
+        logger.debug("🎯 Processing %s address: %s", addr_type, address)
+
+        # Show loading message first
+        loading_embed = discord.Embed(
+            title="🔄 Fetching Real-Time Token Data...",
+            description=f"**Address:** `{address[:20]}...{address[-10:]}`\n**Chain:** {addr_type}",
+            color=0xffaa00
+        )
+        loading_embed.add_field(
+            name="⏳ Status", 
+            value="Scanning multiple APIs for live data...", 
+            inline=False
+        )
+
+        # Fetch real token data while the loading message is being sent
+        if addr_type == "Solana":
+            fetch = get_solana_token_data(address)
+        elif addr_type == "EVM (Ethereum/BSC)":
+            fetch = get_evm_token_data(address)
+        else:
+            fetch = None
 
-    content = message.content.strip()
-    found = []
+        if fetch:
+            loading_msg, token_data = await asyncio.gather(
+                message.channel.send(embed=loading_embed),
+                fetch
+            )
+        else:
+            loading_msg = await message.channel.send(embed=loading_embed)
+            token_data = {'success': False}
+
+        # Create final embed with data
+        token_name = token_data.get('name', 'Unknown Token')
+        token_symbol = token_data.get('symbol', 'UNKNOWN')
+
+        # Choose embed color based on price change
+        price_change = token_data.get('priceChange24h', 0)
+        if price_change > 0:
+            embed_color = 0x00ff88  # Green for positive
+        elif price_change < 0:
+            embed_color = 0xff6b6b  # Red for negative
+        else:
+            embed_color = 0x5865f2  # Blue for neutral
+
+        embed = discord.Embed(
+            title=f"🪙 {token_name} ({token_symbol})",
+            description=f"**Contract:** `{address[:25]}...{address[-15:]}`",
+            color=embed_color if token_data.get('success') else 0x808080
+        )
+
+        if addr_type == "Solana":
+            if token_data.get('success'):
+                price = token_data.get('price', 0)
+                volume = token_data.get('volume24h', 0)
+                liquidity = token_data.get('liquidity', 0)
+                fdv = token_data.get('fdv', 0)
+                mcap = token_data.get('marketCap', 0)
+                change24h = token_data.get('priceChange24h', 0)
+                change1h = token_data.get('priceChange1h', 0)
+
+                # Price info with real data
+                price_info = f"💵 **Price:** {format_number(price)}"
+                if mcap > 0:
+                    price_info += f"\n🏆 **MCap:** {format_number(mcap)}"
+                if fdv > 0:
+                    price_info += f"\n🔥 **FDV:** {format_number(fdv)}"
+                if liquidity > 0:
+                    price_info += f"\n🏊 **Liquidity:** {format_number(liquidity)}"
+                if volume > 0:
+                    price_info += f"\n📈 **Volume 24h:** {format_number(volume)}"
 
-    # Search for all address types in the message
-    for key, pattern in ADDRESS_PATTERNS.items():
-        matches = re.findall(pattern, content)
-        for match in matches:
-            found.append((match, detect_address_type(match)))
+                embed.add_field(
+                    name="💰 Market Data",
+                    value=price_info,
+                    inline=True
+                )
 
-    # If addresses/URLs are found, create embeds for each
-    if found:
-        for address, addr_type in found:
-            try:
-                print(f"🎯 Processing {addr_type} address: {address}")
+                # Performance data
+                perf_info = ""
+                if change1h != 0:
+                    perf_info += f"🕐 **1H:** {format_percentage(change1h)}\n"
+                if change24h != 0:
+                    perf_info += f"📅 **24H:** {format_percentage(change24h)}\n"
+                perf_info += "📆 **7D:** Coming soon"
+
+                embed.add_field(
+                    name="⏰ Performance",
+                    value=perf_info,
+                    inline=True
+                )
 
-                # Show loading message first
-                loading_embed = discord.Embed(
-                    title="🔄 Fetching Real-Time Token Data...",
-                    description=f"**Address:** `{address[:20]}...{address[-10:]}`\n**Chain:** {addr_type}",
-                    color=0xffaa00
+                # Success indicator
+                embed.add_field(
+                    name="✅ Data Status",
+                    value=LIVE_DATA_STATUS_VALUE,
+                    inline=True
                 )
-                loading_embed.add_field(
-                    name="⏳ Status", 
-                    value="Scanning multiple APIs for live data...", 
-                    inline=False
+            else:
+                embed.add_field(
+                    name="💰 Market Data",
+                    value=SOLANA_NOT_FOUND_MARKET_VALUE,
+                    inline=True
+                )
+                embed.add_field(
+                    name="ℹ️ Possible Reasons",
+                    value=POSSIBLE_REASONS_VALUE,
+                    inline=True
                 )
-                loading_msg = await message.channel.send(embed=loading_embed)
-
-                # Fetch real token data
-                token_data = {'success': False}
-
-                if addr_type == "Solana":
-                    token_data = await get_solana_token_data(address)
-                elif addr_type == "EVM (Ethereum/BSC)":
-                    token_data = await get_evm_token_data(address)
-
-                # Create final embed with data
-                token_name = token_data.get('name', 'Unknown Token')
-                token_symbol = token_data.get('symbol', 'UNKNOWN')
-
-                # Choose embed color based on price change
-                price_change = token_data.get('priceChange24h', 0)
-                if price_change > 0:
-                    embed_color = 0x00ff88  # Green for positive
-                elif price_change < 0:
-                    embed_color = 0xff6b6b  # Red for negative
-                else:
-                    embed_color = 0x5865f2  # Blue for neutral
-
-                embed = discord.Embed(
-                    title=f"🪙 {token_name} ({token_symbol})",
-                    description=f"**Contract:** `{address[:25]}...{address[-15:]}`",
-                    color=embed_color if token_data.get('success') else 0x808080
+                embed.add_field(
+                    name="❌ Data Status",
+                    value=NO_DATA_STATUS_VALUE,
+                    inline=True
                 )
 
-                if addr_type == "Solana":
-                    if token_data.get('success'):
-                        price = token_data.get('price', 0)
-                        volume = token_data.get('volume24h', 0)
-                        liquidity = token_data.get('liquidity', 0)
-                        fdv = token_data.get('fdv', 0)
-                        mcap = token_data.get('marketCap', 0)
-                        change24h = token_data.get('priceChange24h', 0)
-                        change1h = token_data.get('priceChange1h', 0)
-
-                        # Price info with real data
-                        price_info = f"💵 **Price:** {format_number(price)}"
-                        if mcap > 0:
-                            price_info += f"\n🏆 **MCap:** {format_number(mcap)}"
-                        if fdv > 0:
-                            price_info += f"\n🔥 **FDV:** {format_number(fdv)}"
-                        if liquidity > 0:
-                            price_info += f"\n🏊 **Liquidity:** {format_number(liquidity)}"
-                        if volume > 0:
-                            price_info += f"\n📈 **Volume 24h:** {format_number(volume)}"
-
-                        embed.add_field(
-                            name="💰 Market Data",
-                            value=price_info,
-                            inline=True
-                        )
-
-                        # Performance data
-                        perf_info = ""
-                        if change1h != 0:
-                            perf_info += f"🕐 **1H:** {format_percentage(change1h)}\n"
-                        if change24h != 0:
-                            perf_info += f"📅 **24H:** {format_percentage(change24h)}\n"
-                        perf_info += "📆 **7D:** Coming soon"
-
-                        embed.add_field(
-                            name="⏰ Performance",
-                            value=perf_info,
-                            inline=True
-                        )
-
-                        # Success indicator
-                        embed.add_field(
-                            name="✅ Data Status",
-                            value="🟢 **Live Data Found**\n📊 Multiple APIs verified\n⚡ Real-time pricing",
-                            inline=True
-                        )
-                    else:
-                        embed.add_field(
-                            name="💰 Market Data",
-                            value="💵 **Price:** Not Available\n🔥 **FDV:** Not Available\n🏊 **Liquidity:** Not Available\n📈 **Volume:** Not Available",
-                            inline=True
-                        )
-                        embed.add_field(
-                            name="ℹ️ Possible Reasons",
-                            value="🔸 Very new token\n🔸 Low trading volume\n🔸 Not listed on DEXs\n🔸 Invalid contract address",
-                            inline=True
-                        )
-                        embed.add_field(
-                            name="❌ Data Status",
-                            value="🔴 **No Live Data**\n📊 Token not found in APIs\n⚠️ Verify contract address",
-                            inline=True
-                        )
-
-                    # Safety warnings for Solana
-                    embed.add_field(
-                        name="🛡️ Safety Reminders",
-                        value="⚠️ **Always verify contracts**\n🔒 **Check for mint/freeze authority**\n💧 **Verify liquidity is locked**\n🚨 **DYOR before investing**",
-                        inline=False
-                    )
-
-                    # Quick links for Solana
-                    links_value = f"[📊 Solscan](https://solscan.io/token/{address}) • "
-                    links_value += f"[🐦 Birdeye](https://birdeye.so/token/{address}) • "
-                    links_value += f"[📈 DexScreener](https://dexscreener.com/solana/{address}) • "
-                    links_value += f"[💹 Jupiter](https://jup.ag/swap/SOL-{address})"
-
-                    embed.add_field(
-                        name="🔗 Quick Access",
-                        value=links_value,
-                        inline=False
-                    )
-
-                elif addr_type == "EVM (Ethereum/BSC)":
-                    if token_data.get('success'):
-                        price = token_data.get('price', 0)
-                        volume = token_data.get('volume24h', 0)
-                        liquidity = token_data.get('liquidity', 0)
-                        mcap = token_data.get('marketCap', 0)
-                        change24h = token_data.get('priceChange24h', 0)
-                        change1h = token_data.get('priceChange1h', 0)
-
-                        # Price info
-                        price_info = f"💵 **Price:** {format_number(price)}"
-                        if mcap > 0:
-                            price_info += f"\n🏆 **MCap:** {format_number(mcap)}"
-                        if liquidity > 0:
-                            price_info += f"\n🏊 **Liquidity:** {format_number(liquidity)}"
-                        if volume > 0:
-                            price_info += f"\n📈 **Volume 24h:** {format_number(volume)}"
-
-                        embed.add_field(
-                            name="💰 Market Data",
-                            value=price_info,
-                            inline=True
-                        )
-
-                        # Performance
-                        perf_info = ""
-                        if change1h != 0:
-                            perf_info += f"🕐 **1H:** {format_percentage(change1h)}\n"
-                        if change24h != 0:
-                            perf_info += f"📅 **24H:** {format_percentage(change24h)}\n"
-                        perf_info += "📆 **7D:** Coming soon"
-
-                        embed.add_field(
-                            name="⏰ Performance",
-                            value=perf_info,
-                            inline=True
-                        )
-
-                        embed.add_field(
-                            name="✅ Data Status",
-                            value="🟢 **Live Data Found**\n📊 Multiple APIs verified\n⚡ Real-time pricing",
-                            inline=True
-                        )
-                    else:
-                        embed.add_field(
-                            name="💰 Market Data",
-                            value="💵 **Price:** Not Available\n🏆 **MCap:** Not Available\n🏊 **Liquidity:** Not Available\n📈 **Volume:** Not Available",
-                            inline=True
-                        )
-                        embed.add_field(
-                            name="ℹ️ Possible Reasons", 
-                            value="🔸 Very new token\n🔸 Low trading volume\n🔸 Not listed on DEXs\n🔸 Invalid contract address",
-                            inline=True
-                        )
-                        embed.add_field(
-                            name="❌ Data Status",
-                            value="🔴 **No Live Data**\n📊 Token not found in APIs\n⚠️ Verify contract address",
-                            inline=True
-                        )
-
-                    # Quick links for EVM
-                    links_value = f"[📊 Etherscan](https://etherscan.io/address/{address}) • "
-                    links_value += f"[🛠️ DexTools](https://www.dextools.io/app/en/ether/pair-explorer/{address}) • "
-                    links_value += f"[📈 DexScreener](https://dexscreener.com/ethereum/{address}) • "
-                    links_value += f"[🦄 Uniswap](https://app.uniswap.org/#/tokens/ethereum/{address})"
-
-                    embed.add_field(
-                        name="🔗 Quick Access",
-                        value=links_value,
-                        inline=False
-                    )
-
-                elif addr_type == "URL":
-                    embed.add_field(
-                        name="🌐 URL Detected",
-                        value="⚠️ **Warning:** Web URL detected\n🔒 **Safety:** Always verify domains\n🛡️ **Tip:** Only click official links\n🚨 **Never connect wallet to suspicious sites**",
-                        inline=False
-                    )
-
-                # Add chain indicator
+            # Safety warnings for Solana
+            embed.add_field(
+                name="🛡️ Safety Reminders",
+                value=SAFETY_REMINDERS_VALUE,
+                inline=False
+            )
+
+            # Quick links for Solana
+            embed.add_field(
+                name="🔗 Quick Access",
+                value=solana_links(address),
+                inline=False
+            )
+
+        elif addr_type == "EVM (Ethereum/BSC)":
+            if token_data.get('success'):
+                price = token_data.get('price', 0)
+                volume = token_data.get('volume24h', 0)
+                liquidity = token_data.get('liquidity', 0)
+                mcap = token_data.get('marketCap', 0)
+                change24h = token_data.get('priceChange24h', 0)
+                change1h = token_data.get('priceChange1h', 0)
+
+                # Price info
+                price_info = f"💵 **Price:** {format_number(price)}"
+                if mcap > 0:
+                    price_info += f"\n🏆 **MCap:** {format_number(mcap)}"
+                if liquidity > 0:
+                    price_info += f"\n🏊 **Liquidity:** {format_number(liquidity)}"
+                if volume > 0:
+                    price_info += f"\n📈 **Volume 24h:** {format_number(volume)}"
+
                 embed.add_field(
-                    name="⛓️ Blockchain",
-                    value=f"**{addr_type}**",
+                    name="💰 Market Data",
+                    value=price_info,
                     inline=True
                 )
 
-                # Footer with requester info
-                embed.set_footer(
-                    text=f"👤 Requested by {message.author.display_name} • 🤖 Live Token Scanner • 📡 Real-time Data",
-                    icon_url=message.author.avatar.url if message.author.avatar else None
+                # Performance
+                perf_info = ""
+                if change1h != 0:
+                    perf_info += f"🕐 **1H:** {format_percentage(change1h)}\n"
+                if change24h != 0:
+                    perf_info += f"📅 **24H:** {format_percentage(change24h)}\n"
+                perf_info += "📆 **7D:** Coming soon"
+
+                embed.add_field(
+                    name="⏰ Performance",
+                    value=perf_info,
+                    inline=True
                 )
 
-                # Add timestamp
-                embed.timestamp = discord.utils.utcnow()
+                embed.add_field(
+                    name="✅ Data Status",
+                    value=LIVE_DATA_STATUS_VALUE,
+                    inline=True
+                )
+            else:
+                embed.add_field(
+                    name="💰 Market Data",
+                    value=EVM_NOT_FOUND_MARKET_VALUE,
+                    inline=True
+                )
+                embed.add_field(
+                    name="ℹ️ Possible Reasons",
+                    value=POSSIBLE_REASONS_VALUE,
+                    inline=True
+                )
+                embed.add_field(
+                    name="❌ Data Status",
+                    value=NO_DATA_STATUS_VALUE,
+                    inline=True
+                )
 
-                # Edit the loading message with final data
-                await loading_msg.edit(embed=embed)
-                print(f"✅ Successfully processed: {token_name} ({token_symbol})")
+            # Quick links for EVM
+            embed.add_field(
+                name="🔗 Quick Access",
+                value=evm_links(address),
+                inline=False
+            )
+
+        elif addr_type == "URL":
+            embed.add_field(
+                name="🌐 URL Detected",
+                value=URL_WARNING_VALUE,
+                inline=False
+            )
+
+        # Add chain indicator
+        embed.add_field(
+            name="⛓️ Blockchain",
+            value=f"**{addr_type}**",
+            inline=True
+        )
+
+        # Footer with requester info
+        embed.set_footer(
+            text=f"👤 Requested by {message.author.display_name} • 🤖 Live Token Scanner • 📡 Real-time Data",
+            icon_url=avatar_url
+        )
+
+        # Add timestamp
+        embed.timestamp = timestamp
+
+        # Edit the loading message with final data
+        await loading_msg.edit(embed=embed)
+        logger.debug("✅ Successfully processed: %s (%s)", token_name, token_symbol)
 
-            except Exception as e:
-                print(f"❌ Error creating embed: {e}")
-                try:
-                    await loading_msg.edit(content=f"❌ Error processing {addr_type} address: `{address}`\nError: {str(e)}")
-                except:
-                    await message.channel.send(f"❌ Error processing {addr_type} address: `{address}`")
+    except Exception as e:
+        logger.error("❌ Error creating embed: %s", e)
+        try:
+            await loading_msg.edit(content=f"❌ Error processing {addr_type} address: `{address}`\nError: {str(e)}")
+        except:
+            await message.channel.send(f"❌ Error processing {addr_type} address: `{address}`")
+
+
+@bot.event
+async def on_message(message):
+    if message.author == bot.user:
+        return
+
+    content = message.content.strip()
+    found = []
+
+    # Search for all address types in the message
+    # finditer never returns overlapping matches, so no Solana hits inside URLs/EVM addresses
+    seen = set()
+    for match in _ADDR_RE.finditer(content):
+        address = match.group()
+        if address in seen:
+            continue
+        seen.add(address)
+        found.append((address, ADDRESS_TYPE_NAMES[match.lastgroup]))
+        if len(found) >= MAX_ADDRESSES_PER_MESSAGE:
+            break
+
+    # If addresses/URLs are found, create embeds for each
+    if found:
+        # Same requester and timestamp for every embed of this message
+        avatar_url = message.author.avatar.url if message.author.avatar else None
+        timestamp = discord.utils.utcnow()
+        results = await asyncio.gather(
+            *(handle_address(message, address, addr_type, avatar_url, timestamp) for address, addr_type in found),
+            return_exceptions=True
+        )
+        for (address, addr_type), result in zip(found, results):
+            if isinstance(result, BaseException):
+                logger.error("❌ Unhandled error for %s address %s", addr_type, address, exc_info=result)
 
     await bot.process_commands(message)
 
@@ -538,7 +806,7 @@ async def test_command(ctx, address: str = None):
         await ctx.send("❌ Invalid address type!")
         return
 
-    await ctx.send(f"📊 Test Result: ```json\n{json.dumps(data, indent=2)}```")
+    await ctx.send(f"📊 Test Result: ```json\n{orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}```")
 
 
 # Info command
@@ -588,7 +856,9 @@ if __name__ == "__main__":
 
     try:
         print("🚀 Starting enhanced token scanner bot...")
-        bot.run(BOT_TOKEN)
+        setup_logging()
+        # Our queue handler already covers discord.py's loggers
+        bot.run(BOT_TOKEN, log_handler=None)
     except discord.LoginFailure:
         print("❌ Invalid bot token! Please check your token.")
     except discord.HTTPException as e: